@@ -7,18 +7,180 @@
 ###########################################################################
 # Native imports
 import os
+import re
+import sys
 import json
 import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
 # 3rd party imports
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.text import Text
 from rich.align import Align
 from rich.prompt import Prompt, Confirm
 from rich.table import Table
 
-console = Console()
+# Optional 3rd party imports
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Highlighting only matters when the output is a styled terminal
+console = Console(highlight=sys.stdout.isatty())
+
+# Set once the Saved Recipes directory is known to exist
+_recipes_dir_ready = False
+
+# Separators used by the recipe displays
+_SEP60 = "=" * 60
+_EQ20 = "═" * 20
+
+# Screen headers, styled once instead of parsing markup on every visit
+_HDR_NEW = Text("═══ Create New Recipe ═══\n", style="bold cyan")
+_HDR_VIEW = Text("═══ View Existing Recipes ═══\n", style="bold cyan")
+_HDR_CALC = Text("═══ Calculate Recipe Portions ═══\n", style="bold cyan")
+_HDR_DELETE = Text("═══ Delete Recipe ═══\n", style="bold red")
+
+# Parsed recipes by path, with the (mtime_ns, size) they were read at
+_RECIPE_CACHE = {}
+
+# Recipe file names by directory, with the directory mtime_ns they were listed at
+_SCAN_CACHE = {}
+
+# Recipe directories larger than this are loaded on a thread pool
+_PARALLEL_LOAD_THRESHOLD = 16
+
+
+def _dumps(data):
+    """Serialize recipe data to indented UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw):
+    """Parse JSON bytes into recipe data"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _list_recipe_entries(recipes_dir):
+    """List (filename, filepath, stat) for each recipe file, rescanning on change"""
+    dir_mtime = os.stat(recipes_dir).st_mtime_ns
+    cached = _SCAN_CACHE.get(recipes_dir)
+    if cached is not None and cached[0] == dir_mtime:
+        # Adding or removing a file bumps the directory mtime, so the names
+        # still hold; each file is re-stat'd to catch edits made in place
+        try:
+            return [(name, path, os.stat(path)) for name, path in cached[1]]
+        except FileNotFoundError:
+            pass
+
+    with os.scandir(recipes_dir) as it:
+        entries = [
+            (entry.name, entry.path, entry.stat())
+            for entry in it
+            if entry.name.endswith(".json") and entry.is_file()
+        ]
+    _SCAN_CACHE[recipes_dir] = (dir_mtime, [(name, path) for name, path, _ in entries])
+    return entries
+
+
+def _short_created_date(recipe_data):
+    """Format a recipe's creation date as YYYY-MM-DD for table rows"""
+    created_date = recipe_data.get("created_date", "Unknown")
+    if created_date != "Unknown":
+        try:
+            date_obj = datetime.datetime.fromisoformat(created_date)
+            return date_obj.strftime("%Y-%m-%d")
+        except:
+            return "Unknown"
+    return "Unknown"
+
+
+def load_recipe(filepath, st=None):
+    """Load a saved recipe, reusing the parsed copy while the file is unchanged"""
+    if st is None:
+        st = os.stat(filepath)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _RECIPE_CACHE.get(filepath)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with open(filepath, "rb") as f:
+        recipe_data = _loads(f.read())
+    # Formatted once here so table rows are a plain lookup
+    recipe_data["_display_date"] = _short_created_date(recipe_data)
+    # (name, quantity, unit) per ingredient, unpacked once for the row loops
+    recipe_data["_ingredients"] = [
+        (
+            ingredient.get("name", "Unknown"),
+            ingredient.get("quantity", 0),
+            ingredient.get("unit", ""),
+        )
+        for ingredient in recipe_data.get("ingredients", [])
+    ]
+    _RECIPE_CACHE[filepath] = (key, recipe_data)
+    return recipe_data
+
+
+def _parse_quick_ingredient(entry):
+    """Split a 'name, unit, quantity' entry, or return None if it isn't one"""
+    parts = [part.strip() for part in entry.rsplit(",", 2)]
+    if len(parts) != 3 or not all(parts):
+        return None
+    try:
+        return parts[0], parts[1], float(parts[2])
+    except ValueError:
+        return None
+
+
+def _parse_selection(choice, count):
+    """Parse picks like '3', '1,3,5' or '2-4' into sorted unique numbers
+
+    Returns None if any pick falls outside 1..count, and raises ValueError
+    for anything that isn't a number or an ascending range.
+    """
+    choice_nums = set()
+    for token in choice.split(","):
+        start, _, end = token.partition("-")
+        first = int(start)
+        last = int(end) if end else first
+        if last < first:
+            raise ValueError(f"invalid range: {token.strip()}")
+        if first < 1 or last > count:
+            return None
+        choice_nums.update(range(first, last + 1))
+    return sorted(choice_nums)
+
+
+def _open_dir_fd(path):
+    """Open a directory for dir_fd-relative unlinks, or None if unavailable"""
+    if os.unlink not in os.supports_dir_fd:
+        return None
+    try:
+        return os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=32)
+def _dyn_sep(n):
+    """Return a double-line separator of length n"""
+    return "═" * n
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_qty(qty, precision=2):
+    """Format a quantity without unnecessary decimal places"""
+    int_qty = int(qty)
+    if qty == int_qty:
+        return str(int_qty)
+    return f"{qty:.{precision}f}".rstrip("0").rstrip(".")
 
 
 def main():
@@ -43,78 +205,77 @@ def main():
             input("Press Enter to continue...")
 
 
-def drawMenu():
+def _build_menu():
+    """Render the static main menu box once as a styled Text"""
     width = 42
-    lines = [
-        "Recipe Calculator",
-        "",  # Empty line
-        "1. Calculate recipe",
-        "2. View existing recipes",
-        "3. New recipe",
-        "4. Delete recipe",
-        "Q. Exit",
-        "",  # Empty line
+    title = "Recipe Calculator"
+    items = [
+        ("", "cyan"),  # Empty line
+        ("1. Calculate recipe", "yellow"),  # Calculate - yellow
+        ("2. View existing recipes", "green"),  # View - green
+        ("3. New recipe", "violet"),  # New - violet
+        ("4. Delete recipe", "red"),  # Delete - red
+        ("Q. Exit", "bold white"),  # Exit - bold white
+        ("", "cyan"),  # Empty line
     ]
+    border = "═" * width
+    menu = Text()
+
+    def add_line(line, style):
+        # Highlight like console.print would for a plain string
+        text = Text(line + "\n", style=style)
+        console.highlighter.highlight(text)
+        menu.append_text(text)
 
     # Top border - cyan color because that's beautiful
-    console.print("╔" + "═" * width + "╗", style="cyan")
+    add_line(f"╔{border}╗", "cyan")
 
     # Title with separator - bold cyan
-    title = lines[0]
-    padding = (width - len(title)) // 2
-    title_line = (
-        "║" + " " * padding + title + " " * (width - len(title) - padding) + "║"
-    )
-    console.print(title_line, style="bold cyan")
-    console.print("╠" + "═" * width + "╣", style="cyan")
-
-    # Menu items
-    for line in lines[1:]:
-        if line == "":
-            # Empty line
-            console.print("║" + " " * width + "║", style="cyan")
-        else:
-            # Menu items with colors
-            padded_line = "  " + line
-            remaining_space = width - len(padded_line)
-            menu_line = "║" + padded_line + " " * remaining_space + "║"
-
-            # Color different menu items
-            if line.startswith("1."):
-                console.print(menu_line, style="yellow")  # Calculate - yellow
-            elif line.startswith("2."):
-                console.print(menu_line, style="green")  # View - green
-            elif line.startswith("3."):
-                console.print(menu_line, style="violet")  # New - violet
-            elif line.startswith("4."):
-                console.print(menu_line, style="red")  # Delete - red
-            elif line.startswith("Q."):
-                console.print(menu_line, style="bold white")  # Exit - bold white
-            else:
-                console.print(menu_line, style="cyan")
+    add_line(f"║{title:^{width}}║", "bold cyan")
+    add_line(f"╠{border}╣", "cyan")
+
+    # Menu items, indented and padded to the box width
+    for line, style in items:
+        add_line(f"║{'  ' + line:<{width}}║", style)
 
     # Bottom border - cyan color
-    console.print("╚" + "═" * width + "╝", style="cyan")
+    add_line(f"╚{border}╝", "cyan")
+
+    menu.rstrip()
+    return menu
+
+
+# Built once at import; the menu is redrawn on every pass of mainMenuChoice
+_MENU_TEXT = _build_menu()
+
+
+def drawMenu():
+    console.print(_MENU_TEXT)
+
+
+# Main menu prompt, built once and reused on every pass of mainMenuChoice
+_CHOICES = ("1", "2", "3", "4", "q", "Q")
+_PROMPT_TEXT = "\n[bold yellow]Enter your choice[/bold yellow]"
+_MENU_PROMPT = Prompt(_PROMPT_TEXT, choices=_CHOICES, show_choices=False)
+_ACTION_CHOICES = frozenset({"1", "2", "3", "4"})
+
+# Answers accepted by the recipe pickers' "Search by name?" question
+_SEARCH_CHOICES = ("y", "n", "Y", "N")
 
 
 def mainMenuChoice():
-    while True:
-        # Clear the console
-        console.clear()
-        # Draw the menu
-        drawMenu()
-
-        # Get user input with Rich prompt
-        choice = Prompt.ask(
-            "\n[bold yellow]Enter your choice[/bold yellow]",
-            choices=["1", "2", "3", "4", "q", "Q"],
-            show_choices=False,
-        ).lower()
-
-        if choice in ["1", "2", "3", "4"]:
-            return choice
-        elif choice == "q":
-            return None
+    # Clear the console
+    console.clear()
+    # Draw the menu
+    drawMenu()
+
+    # Get user input with the shared Rich prompt; it re-asks in place until
+    # one of the menu choices is entered
+    choice = _MENU_PROMPT().casefold()
+
+    if choice in _ACTION_CHOICES:
+        return choice
+    return None
 
 
 def new_recipe():
@@ -122,13 +283,14 @@ def new_recipe():
 
     # Clear screen for new recipe creation
     console.clear()
-    console.print("[bold cyan]═══ Create New Recipe ═══[/bold cyan]\n")
+    console.print(_HDR_NEW)
 
-    # Ensure the Saved Recipes directory exists
+    # Ensure the Saved Recipes directory exists (checked once per session)
+    global _recipes_dir_ready
     recipes_dir = "Saved Recipes"
-    if not os.path.exists(recipes_dir):
-        os.makedirs(recipes_dir)
-        console.print(f"[green]Created directory: {recipes_dir}[/green]\n")
+    if not _recipes_dir_ready:
+        os.makedirs(recipes_dir, exist_ok=True)
+        _recipes_dir_ready = True
 
     # Get recipe name
     while True:
@@ -142,10 +304,14 @@ def new_recipe():
             break
         console.print("[red]Recipe name cannot be empty. Please try again.[/red]")
 
+    # Path separators would point the file outside Saved Recipes
+    safe_name = recipe_name.replace("/", "_").replace("\\", "_")
+
     # Check if file already exists
-    filename = f"{recipe_name}.json"
+    filename = safe_name + ".json"
     filepath = os.path.join(recipes_dir, filename)
 
+    overwrite = False
     if os.path.exists(filepath):
         overwrite = Confirm.ask(
             f"[yellow]A recipe named '{recipe_name}' already exists. Do you want to overwrite it?[/yellow]"
@@ -157,60 +323,66 @@ def new_recipe():
     # Get recipe notes
     console.print("\n[bold cyan]Enter recipe notes/instructions:[/bold cyan]")
     console.print(
-        "[dim]Press Enter twice when finished, or type 'DONE' on a line by itself[/dim]"
+        "[dim]Press Enter twice when finished, type 'DONE' on a line by itself, "
+        "or press Ctrl-D after pasting[/dim]"
     )
 
     notes_lines = []
-    empty_line_count = 0
 
     while True:
-        line = input()
+        # Read straight from stdin; input() flushes both streams per line
+        line = sys.stdin.readline()
+        if not line:
+            # End of input (Ctrl-D) finishes a pasted block
+            break
+        line = line.rstrip("\n")
         if line.strip().upper() == "DONE":
             break
-        if line.strip() == "":
-            empty_line_count += 1
-            if empty_line_count >= 2:
-                break
-            notes_lines.append(line)
-        else:
-            empty_line_count = 0
-            notes_lines.append(line)
-
-    # Remove trailing empty lines
-    while notes_lines and notes_lines[-1].strip() == "":
-        notes_lines.pop()
+        # A second empty line in a row finishes the notes
+        if not line.strip() and notes_lines and not notes_lines[-1].strip():
+            break
+        notes_lines.append(line)
 
-    notes = "\n".join(notes_lines)
+    # Join and drop trailing blank lines in one pass
+    notes = "\n".join(notes_lines).rstrip()
 
     # Get ingredients
     ingredients = []
     console.print("\n[bold cyan]Now let's add ingredients:[/bold cyan]")
 
     while True:
-        # Get ingredient name
-        ingredient_name = Prompt.ask("[yellow]Ingredient name[/yellow]").strip()
-        if not ingredient_name:
+        # Get ingredient name, or the whole ingredient on one line
+        entry = Prompt.ask(
+            "[yellow]Ingredient name[/yellow] [dim](or 'name, unit, quantity')[/dim]"
+        ).strip()
+        if not entry:
             console.print("[red]Ingredient name cannot be empty.[/red]")
             continue
 
-        # Get unit measurement
-        unit = Prompt.ask(
-            f"[yellow]Unit of measurement for {ingredient_name}[/yellow] (e.g., cups, tbsp, lbs)"
-        ).strip()
-        if not unit:
-            console.print("[red]Unit cannot be empty.[/red]")
-            continue
+        quick_entry = _parse_quick_ingredient(entry)
+        if quick_entry:
+            ingredient_name, unit, quantity = quick_entry
+        else:
+            ingredient_name = entry
 
-        # Get quantity (float value)
-        while True:
-            try:
-                quantity_str = Prompt.ask(
-                    f"[yellow]Quantity of {ingredient_name} in {unit}[/yellow]"
-                )
-                quantity = float(quantity_str)
-                break
-            except ValueError:
-                console.print("[red]Please enter a valid number.[/red]")
+            # Get unit measurement
+            unit = Prompt.ask(
+                f"[yellow]Unit of measurement for {ingredient_name}[/yellow] (e.g., cups, tbsp, lbs)"
+            ).strip()
+            if not unit:
+                console.print("[red]Unit cannot be empty.[/red]")
+                continue
+
+            # Get quantity (float value)
+            while True:
+                try:
+                    quantity_str = Prompt.ask(
+                        f"[yellow]Quantity of {ingredient_name} in {unit}[/yellow]"
+                    )
+                    quantity = float(quantity_str)
+                    break
+                except ValueError:
+                    console.print("[red]Please enter a valid number.[/red]")
 
         # Add ingredient to list
         ingredients.append(
@@ -238,8 +410,11 @@ def new_recipe():
     # Confirm before saving
     if Confirm.ask("\n[bold green]Save this recipe?[/bold green]"):
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(recipe_data, f, indent=2, ensure_ascii=False)
+            # Exclusive create stops a recipe saved meanwhile under the same
+            # name from being clobbered unless the user agreed to overwrite
+            with open(filepath, "wb" if overwrite else "xb") as f:
+                f.write(_dumps(recipe_data))
+            _RECIPE_CACHE.pop(filepath, None)
 
             console.print(
                 f"\n[bold green]✓ Recipe '{recipe_name}' saved successfully![/bold green]"
@@ -254,48 +429,90 @@ def new_recipe():
 
 def display_recipe_preview(recipe_data):
     """Display a formatted preview of the recipe"""
-    console.print("\n" + "=" * 60)
-    console.print(f"[bold cyan]Recipe Preview[/bold cyan]")
-    console.print("=" * 60)
+    # Collect everything first and print it as one group
+    parts = ["\n" + _SEP60, f"[bold cyan]Recipe Preview[/bold cyan]", _SEP60]
 
     # Recipe name
-    console.print(f"\n[bold yellow]Name:[/bold yellow] {recipe_data['name']}")
+    parts.append(f"\n[bold yellow]Name:[/bold yellow] {recipe_data['name']}")
 
     # Notes
     if recipe_data["notes"].strip():
-        console.print(f"\n[bold yellow]Notes/Instructions:[/bold yellow]")
+        parts.append(f"\n[bold yellow]Notes/Instructions:[/bold yellow]")
         # Display notes in a panel for better formatting
-        notes_panel = Panel(recipe_data["notes"], border_style="dim")
-        console.print(notes_panel)
+        parts.append(Panel(recipe_data["notes"], border_style="dim"))
 
     # Ingredients table
     if recipe_data["ingredients"]:
-        console.print(f"\n[bold yellow]Ingredients:[/bold yellow]")
+        parts.append(f"\n[bold yellow]Ingredients:[/bold yellow]")
 
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Ingredient", style="cyan")
         table.add_column("Quantity", style="green", justify="right")
         table.add_column("Unit", style="yellow")
 
-        for ingredient in recipe_data["ingredients"]:
-            # Format quantity to remove unnecessary decimal places
-            qty = ingredient["quantity"]
-            if qty == int(qty):
-                qty_str = str(int(qty))
-            else:
-                qty_str = f"{qty:.2f}".rstrip("0").rstrip(".")
+        rows = [
+            (ingredient["name"], _fmt_qty(ingredient["quantity"]), ingredient["unit"])
+            for ingredient in recipe_data["ingredients"]
+        ]
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
 
-            table.add_row(ingredient["name"], qty_str, ingredient["unit"])
+        parts.append(table)
 
-        console.print(table)
+    parts.append(_SEP60)
+    console.print(Group(*parts))
 
-    console.print("=" * 60)
 
+def _try_load_recipe(entry):
+    """Load one scanned recipe entry, returning the exception if it fails"""
+    filename, filepath, st = entry
+    try:
+        return load_recipe(filepath, st)
+    except Exception as e:
+        return e
 
-def view_recipes():
-    """View all existing recipes"""
+
+def _load_all_recipes(recipes_dir):
+    """Load every saved recipe as (filename, recipe_data), sorted by name"""
+    entries = _list_recipe_entries(recipes_dir)
+
+    # Overlap the file reads once there are enough of them to be worth it
+    if len(entries) > _PARALLEL_LOAD_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=min(32, len(entries))) as executor:
+            results = list(executor.map(_try_load_recipe, entries))
+    else:
+        results = map(_try_load_recipe, entries)
+
+    all_recipes = []
+    for (filename, _, _), result in zip(entries, results):
+        if isinstance(result, Exception):
+            console.print(f"[red]Error reading {filename}: {result}[/red]")
+            continue
+        all_recipes.append((filename, result))
+
+    # Sort recipes alphabetically by name
+    all_recipes.sort(key=lambda x: x[1].get("name", x[0]).lower())
+    return all_recipes
+
+
+def _base_ingredient_info(recipe_data):
+    """Describe a recipe's first ingredient, which calculations scale from"""
+    ingredients = recipe_data.get("ingredients", [])
+    if ingredients:
+        first_ingredient = ingredients[0]
+        return f"{first_ingredient.get('name', 'Unknown')} ({first_ingredient.get('unit', 'units')})"
+    return "No ingredients"
+
+
+def _browse_recipes(header, verb, column, on_select):
+    """Let the user search and pick saved recipes, calling on_select on each
+
+    column is the (title, style, width, value) of the table's third column,
+    where value(recipe_data) returns the cell text.
+    """
     console.clear()
-    console.print("[bold cyan]═══ View Existing Recipes ═══[/bold cyan]\n")
+    console.print(header)
 
     recipes_dir = "Saved Recipes"
 
@@ -306,160 +523,156 @@ def view_recipes():
         )
         return
 
-    # Get all JSON files in the recipes directory
-    recipe_files = [f for f in os.listdir(recipes_dir) if f.endswith(".json")]
+    # Load all recipe data, sorted by name
+    all_recipes = _load_all_recipes(recipes_dir)
 
-    if not recipe_files:
+    if not all_recipes:
         console.print("[yellow]No recipes found. Create some recipes first![/yellow]")
         return
 
-    # Load all recipe data
-    all_recipes = []
-    for filename in recipe_files:
-        filepath = os.path.join(recipes_dir, filename)
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                recipe_data = json.load(f)
-            all_recipes.append((filename, recipe_data))
-        except Exception as e:
-            console.print(f"[red]Error reading {filename}: {e}[/red]")
-            continue
-
-    # Sort recipes alphabetically by name
-    all_recipes.sort(key=lambda x: x[1].get("name", x[0]).lower())
-
-    # Search functionality
-    filtered_recipes = all_recipes
-    search_term = ""
-
-    # Only show search option if there are more than 5 recipes
-    if len(all_recipes) > 5:
-        search_choice = Prompt.ask(
-            f"[cyan]Found {len(all_recipes)} recipes. Search by name? (y/n)[/cyan]",
-        ).lower()
-
-        if search_choice == "y":
-            search_term = Prompt.ask(
-                "[yellow]Enter search term (recipe name)[/yellow]"
-            ).strip()
-
-            if search_term:
-                # Filter recipes by name (case-insensitive, partial matching)
-                filtered_recipes = [
-                    (filename, recipe_data)
-                    for filename, recipe_data in all_recipes
-                    if search_term.lower()
-                    in recipe_data.get("name", filename.replace(".json", "")).lower()
-                ]
+    # Lowercased names to search against, built once for all searches
+    name_index = [
+        (
+            recipe_data.get("name", filename.replace(".json", "")).lower(),
+            filename,
+            recipe_data,
+        )
+        for filename, recipe_data in all_recipes
+    ]
 
-                if filtered_recipes:
-                    console.print(
-                        f"\n[green]Found {len(filtered_recipes)} recipe(s) matching '{search_term}':[/green]\n"
-                    )
+    # Repeat searches reuse the recipes loaded above
+    while True:
+        # Search functionality
+        filtered_recipes = all_recipes
+        search_term = ""
+
+        # Only show search option if there are more than 5 recipes
+        if len(all_recipes) > 5:
+            search_choice = Prompt.ask(
+                f"[cyan]Found {len(all_recipes)} recipes. Search by name? (y/n)[/cyan]",
+                choices=_SEARCH_CHOICES,
+                default="n",
+            ).casefold()
+
+            if search_choice == "y":
+                search_term = Prompt.ask(
+                    "[yellow]Enter search term (recipe name)[/yellow]"
+                ).strip()
+
+                if search_term:
+                    # Filter recipes by name (case-insensitive, partial matching)
+                    term_lower = search_term.lower()
+                    filtered_recipes = [
+                        (filename, recipe_data)
+                        for name_lower, filename, recipe_data in name_index
+                        if term_lower in name_lower
+                    ]
+
+                    if filtered_recipes:
+                        console.print(
+                            f"\n[green]Found {len(filtered_recipes)} recipe(s) matching '{search_term}':[/green]\n"
+                        )
+                    else:
+                        console.print(
+                            f"\n[yellow]No recipes found matching '{search_term}'. Showing all recipes:[/yellow]\n"
+                        )
+                        filtered_recipes = all_recipes
                 else:
                     console.print(
-                        f"\n[yellow]No recipes found matching '{search_term}'. Showing all recipes:[/yellow]\n"
+                        f"\n[yellow]No search term entered. Showing all recipes:[/yellow]\n"
                     )
-                    filtered_recipes = all_recipes
-            else:
-                console.print(
-                    f"\n[yellow]No search term entered. Showing all recipes:[/yellow]\n"
-                )
-    else:
-        console.print(f"[green]Found {len(all_recipes)} recipe(s):[/green]\n")
-
-    # Create a table of available recipes
-    recipes_table = Table(show_header=True, header_style="bold magenta")
-    recipes_table.add_column("#", style="cyan", width=3)
-    recipes_table.add_column("Recipe Name", style="white")
-    recipes_table.add_column("Created", style="dim", width=12)
+        else:
+            console.print(f"[green]Found {len(all_recipes)} recipe(s):[/green]\n")
 
-    recipe_data_list = []
+        # Create a table of available recipes
+        recipes_table = Table(show_header=True, header_style="bold magenta")
+        recipes_table.add_column("#", style="cyan", width=3)
+        recipes_table.add_column("Recipe Name", style="white")
+        column_title, column_style, column_width, column_value = column
+        recipes_table.add_column(column_title, style=column_style, width=column_width)
 
-    for i, (filename, recipe_data) in enumerate(filtered_recipes, 1):
-        # Get recipe name and creation date
-        recipe_name = recipe_data.get("name", filename.replace(".json", ""))
-        created_date = recipe_data.get("created_date", "Unknown")
+        recipe_data_list = []
 
-        # Format date for display
-        if created_date != "Unknown":
-            try:
-                date_obj = datetime.datetime.fromisoformat(created_date)
-                formatted_date = date_obj.strftime("%Y-%m-%d")
-            except:
-                formatted_date = "Unknown"
-        else:
-            formatted_date = "Unknown"
-
-        # Highlight search term if it exists
-        display_name = recipe_name
-        if search_term and search_term.lower() in recipe_name.lower():
-            # Find the matching part and highlight it
-            start_idx = recipe_name.lower().find(search_term.lower())
-            if start_idx != -1:
-                end_idx = start_idx + len(search_term)
-                display_name = (
-                    recipe_name[:start_idx]
-                    + f"[bold yellow]{recipe_name[start_idx:end_idx]}[/bold yellow]"
-                    + recipe_name[end_idx:]
-                )
+        # Compiled once per search for highlighting the matches in each row
+        search_pattern = (
+            re.compile(re.escape(search_term), re.IGNORECASE) if search_term else None
+        )
 
-        recipes_table.add_row(str(i), display_name, formatted_date)
-        recipe_data_list.append((filename, recipe_data))
+        for i, (filename, recipe_data) in enumerate(filtered_recipes, 1):
+            recipe_name = recipe_data.get("name", filename.replace(".json", ""))
 
-    console.print(recipes_table)
+            # Highlight search term if it exists
+            display_name = Text(recipe_name)
+            if search_pattern:
+                display_name.highlight_regex(search_pattern, "bold yellow")
 
-    # Let user select a recipe to view
-    while True:
-        try:
-            prompt_text = f"\n[bold yellow]Enter recipe number to view (1-{len(recipe_data_list)})"
-            if search_term:
-                prompt_text += f", 's' to search again,"
-            prompt_text += f" or 'q' to go back[/bold yellow]"
+            recipes_table.add_row(str(i), display_name, column_value(recipe_data))
+            recipe_data_list.append((filename, recipe_data))
 
-            choice = Prompt.ask(prompt_text, default="q").strip().lower()
+        console.print(recipes_table)
 
-            if choice == "q":
-                return
-            elif choice == "s" and search_term:
-                # Start over with new search
-                view_recipes()
-                return
+        # Let user select a recipe
+        while True:
+            try:
+                prompt_text = f"\n[bold yellow]Enter recipe number to {verb} (1-{len(recipe_data_list)})"
+                if search_term:
+                    prompt_text += f", 's' to search again,"
+                prompt_text += f" or 'q' to go back[/bold yellow]"
 
-            choice_num = int(choice)
-            if 1 <= choice_num <= len(recipe_data_list):
-                filename, recipe_data = recipe_data_list[choice_num - 1]
-                display_full_recipe(recipe_data)
+                choice = Prompt.ask(prompt_text, default="q").strip().lower()
 
-                # Ask if they want to view another recipe
-                if not Confirm.ask("\n[cyan]View another recipe?[/cyan]"):
+                if choice == "q":
                     return
-                else:
-                    # Return to the search results, not start over
+                elif choice == "s" and search_term:
+                    # Start over with a new search on the already loaded recipes
                     console.clear()
+                    console.print(header)
+                    break
+
+                choice_num = int(choice)
+                if 1 <= choice_num <= len(recipe_data_list):
+                    filename, recipe_data = recipe_data_list[choice_num - 1]
+                    on_select(recipe_data)
+
+                    # Ask if they want to pick another recipe
+                    if not Confirm.ask(
+                        f"\n[cyan]{verb.capitalize()} another recipe?[/cyan]"
+                    ):
+                        return
+                    else:
+                        # Return to the search results, not start over
+                        console.clear()
+                        console.print(header)
+                        if search_term:
+                            console.print(
+                                f"[green]Showing {len(filtered_recipes)} recipe(s) matching '{search_term}':[/green]\n"
+                            )
+                        else:
+                            console.print(
+                                f"[green]Found {len(filtered_recipes)} recipe(s):[/green]\n"
+                            )
+                        console.print(recipes_table)
+                else:
                     console.print(
-                        "[bold cyan]═══ View Existing Recipes ═══[/bold cyan]\n"
+                        f"[red]Please enter a number between 1 and {len(recipe_data_list)}[/red]"
                     )
-                    if search_term:
-                        console.print(
-                            f"[green]Showing {len(filtered_recipes)} recipe(s) matching '{search_term}':[/green]\n"
-                        )
-                    else:
-                        console.print(
-                            f"[green]Found {len(filtered_recipes)} recipe(s):[/green]\n"
-                        )
-                    console.print(recipes_table)
-            else:
+
+            except ValueError:
                 console.print(
-                    f"[red]Please enter a number between 1 and {len(recipe_data_list)}[/red]"
+                    "[red]Please enter a valid number, 's' to search again, or 'q' to quit[/red]"
                 )
+            except KeyboardInterrupt:
+                return
 
-        except ValueError:
-            console.print(
-                "[red]Please enter a valid number, 's' to search again, or 'q' to quit[/red]"
-            )
-        except KeyboardInterrupt:
-            return
+
+def view_recipes():
+    """View all existing recipes"""
+    _browse_recipes(
+        _HDR_VIEW,
+        "view",
+        ("Created", "dim", 12, lambda recipe_data: recipe_data["_display_date"]),
+        display_full_recipe,
+    )
 
 
 def display_full_recipe(recipe_data):
@@ -468,7 +681,7 @@ def display_full_recipe(recipe_data):
 
     # Recipe header
     recipe_name = recipe_data.get("name", "Unknown Recipe")
-    console.print(f"[bold cyan]{'═' * 20} {recipe_name} {'═' * 20}[/bold cyan]")
+    parts = [f"[bold cyan]{_EQ20} {recipe_name} {_EQ20}[/bold cyan]"]
 
     # Created date
     created_date = recipe_data.get("created_date", "Unknown")
@@ -476,14 +689,14 @@ def display_full_recipe(recipe_data):
         try:
             date_obj = datetime.datetime.fromisoformat(created_date)
             formatted_date = date_obj.strftime("%B %d, %Y at %I:%M %p")
-            console.print(f"[dim]Created: {formatted_date}[/dim]\n")
+            parts.append(f"[dim]Created: {formatted_date}[/dim]\n")
         except:
-            console.print(f"[dim]Created: {created_date}[/dim]\n")
+            parts.append(f"[dim]Created: {created_date}[/dim]\n")
 
     # Ingredients section
     ingredients = recipe_data.get("ingredients", [])
     if ingredients:
-        console.print("[bold yellow]🥘 Ingredients:[/bold yellow]")
+        parts.append("[bold yellow]🥘 Ingredients:[/bold yellow]")
 
         ingredients_table = Table(
             show_header=True, header_style="bold magenta", box=None
@@ -492,25 +705,21 @@ def display_full_recipe(recipe_data):
         ingredients_table.add_column("Amount", style="green", justify="right")
         ingredients_table.add_column("Unit", style="yellow")
 
-        for ingredient in ingredients:
-            qty = ingredient.get("quantity", 0)
-            # Format quantity nicely
-            if qty == int(qty):
-                qty_str = str(int(qty))
-            else:
-                qty_str = f"{qty:.2f}".rstrip("0").rstrip(".")
-
-            ingredients_table.add_row(
-                ingredient.get("name", "Unknown"), qty_str, ingredient.get("unit", "")
-            )
+        rows = [
+            (name, _fmt_qty(qty), unit)
+            for name, qty, unit in recipe_data["_ingredients"]
+        ]
+        add_row = ingredients_table.add_row
+        for row in rows:
+            add_row(*row)
 
-        console.print(ingredients_table)
-        console.print()
+        parts.append(ingredients_table)
+        parts.append("")
 
     # Notes/Instructions section
     notes = recipe_data.get("notes", "").strip()
     if notes:
-        console.print("[bold yellow]📝 Instructions:[/bold yellow]")
+        parts.append("[bold yellow]📝 Instructions:[/bold yellow]")
         notes_panel = Panel(
             notes,
             border_style="blue",
@@ -518,179 +727,22 @@ def display_full_recipe(recipe_data):
             title="Recipe Notes",
             title_align="left",
         )
-        console.print(notes_panel)
+        parts.append(notes_panel)
     else:
-        console.print("[dim]No instructions provided.[/dim]")
+        parts.append("[dim]No instructions provided.[/dim]")
 
-    console.print(f"\n[bold cyan]{'═' * (42 + len(recipe_name))}[/bold cyan]")
+    parts.append(f"\n[bold cyan]{_dyn_sep(42 + len(recipe_name))}[/bold cyan]")
+    console.print(Group(*parts))
 
 
 def calculate_recipe():
     """Calculate scaled recipe amounts based on user input"""
-    console.clear()
-    console.print("[bold cyan]═══ Calculate Recipe Portions ═══[/bold cyan]\n")
-
-    recipes_dir = "Saved Recipes"
-
-    # Check if recipes directory exists
-    if not os.path.exists(recipes_dir):
-        console.print(
-            "[yellow]No recipes directory found. Create some recipes first![/yellow]"
-        )
-        return
-
-    # Get all JSON files in the recipes directory
-    recipe_files = [f for f in os.listdir(recipes_dir) if f.endswith(".json")]
-
-    if not recipe_files:
-        console.print("[yellow]No recipes found. Create some recipes first![/yellow]")
-        return
-
-    # Load all recipe data
-    all_recipes = []
-    for filename in recipe_files:
-        filepath = os.path.join(recipes_dir, filename)
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                recipe_data = json.load(f)
-            all_recipes.append((filename, recipe_data))
-        except Exception as e:
-            console.print(f"[red]Error reading {filename}: {e}[/red]")
-            continue
-
-    # Sort recipes alphabetically by name
-    all_recipes.sort(key=lambda x: x[1].get("name", x[0]).lower())
-
-    # Search functionality
-    filtered_recipes = all_recipes
-    search_term = ""
-
-    # Only show search option if there are more than 5 recipes
-    if len(all_recipes) > 5:
-        search_choice = Prompt.ask(
-            f"[cyan]Found {len(all_recipes)} recipes. Search by name? (y/n)[/cyan]",
-            choices=["y", "n", "Y", "N"],
-            default="n",
-        ).lower()
-
-        if search_choice == "y":
-            search_term = Prompt.ask(
-                "[yellow]Enter search term (recipe name)[/yellow]"
-            ).strip()
-
-            if search_term:
-                # Filter recipes by name (case-insensitive, partial matching)
-                filtered_recipes = [
-                    (filename, recipe_data)
-                    for filename, recipe_data in all_recipes
-                    if search_term.lower()
-                    in recipe_data.get("name", filename.replace(".json", "")).lower()
-                ]
-
-                if filtered_recipes:
-                    console.print(
-                        f"\n[green]Found {len(filtered_recipes)} recipe(s) matching '{search_term}':[/green]\n"
-                    )
-                else:
-                    console.print(
-                        f"\n[yellow]No recipes found matching '{search_term}'. Showing all recipes:[/yellow]\n"
-                    )
-                    filtered_recipes = all_recipes
-            else:
-                console.print(
-                    f"\n[yellow]No search term entered. Showing all recipes:[/yellow]\n"
-                )
-    else:
-        console.print(f"[green]Found {len(all_recipes)} recipe(s):[/green]\n")
-
-    # Create a table of available recipes
-    recipes_table = Table(show_header=True, header_style="bold magenta")
-    recipes_table.add_column("#", style="cyan", width=3)
-    recipes_table.add_column("Recipe Name", style="white")
-    recipes_table.add_column("Base Ingredient", style="yellow")
-
-    recipe_data_list = []
-
-    for i, (filename, recipe_data) in enumerate(filtered_recipes, 1):
-        recipe_name = recipe_data.get("name", filename.replace(".json", ""))
-        ingredients = recipe_data.get("ingredients", [])
-
-        # Get the first ingredient as the base
-        if ingredients:
-            first_ingredient = ingredients[0]
-            base_info = f"{first_ingredient.get('name', 'Unknown')} ({first_ingredient.get('unit', 'units')})"
-        else:
-            base_info = "No ingredients"
-
-        # Highlight search term if it exists
-        display_name = recipe_name
-        if search_term and search_term.lower() in recipe_name.lower():
-            # Find the matching part and highlight it
-            start_idx = recipe_name.lower().find(search_term.lower())
-            if start_idx != -1:
-                end_idx = start_idx + len(search_term)
-                display_name = (
-                    recipe_name[:start_idx]
-                    + f"[bold yellow]{recipe_name[start_idx:end_idx]}[/bold yellow]"
-                    + recipe_name[end_idx:]
-                )
-
-        recipes_table.add_row(str(i), display_name, base_info)
-        recipe_data_list.append((filename, recipe_data))
-
-    console.print(recipes_table)
-
-    # Let user select a recipe
-    while True:
-        try:
-            prompt_text = f"\n[bold yellow]Enter recipe number to calculate (1-{len(recipe_data_list)})"
-            if search_term:
-                prompt_text += f", 's' to search again,"
-            prompt_text += f" or 'q' to go back[/bold yellow]"
-
-            choice = Prompt.ask(prompt_text, default="q").strip().lower()
-
-            if choice == "q":
-                return
-            elif choice == "s" and search_term:
-                # Start over with new search
-                calculate_recipe()
-                return
-
-            choice_num = int(choice)
-            if 1 <= choice_num <= len(recipe_data_list):
-                filename, recipe_data = recipe_data_list[choice_num - 1]
-                perform_recipe_calculation(recipe_data)
-
-                # Ask if they want to calculate another recipe
-                if not Confirm.ask("\n[cyan]Calculate another recipe?[/cyan]"):
-                    return
-                else:
-                    # Return to the search results, not start over
-                    console.clear()
-                    console.print(
-                        "[bold cyan]═══ Calculate Recipe Portions ═══[/bold cyan]\n"
-                    )
-                    if search_term:
-                        console.print(
-                            f"[green]Showing {len(filtered_recipes)} recipe(s) matching '{search_term}':[/green]\n"
-                        )
-                    else:
-                        console.print(
-                            f"[green]Found {len(filtered_recipes)} recipe(s):[/green]\n"
-                        )
-                    console.print(recipes_table)
-            else:
-                console.print(
-                    f"[red]Please enter a number between 1 and {len(recipe_data_list)}[/red]"
-                )
-
-        except ValueError:
-            console.print(
-                "[red]Please enter a valid number, 's' to search again, or 'q' to quit[/red]"
-            )
-        except KeyboardInterrupt:
-            return
+    _browse_recipes(
+        _HDR_CALC,
+        "calculate",
+        ("Base Ingredient", "yellow", None, _base_ingredient_info),
+        perform_recipe_calculation,
+    )
 
 
 def perform_recipe_calculation(recipe_data):
@@ -747,25 +799,17 @@ def perform_recipe_calculation(recipe_data):
     scaled_table.add_column("Your Amount", style="green", justify="right")
     scaled_table.add_column("Unit", style="yellow")
 
-    for ingredient in ingredients:
-        name = ingredient.get("name", "Unknown")
-        original_qty = ingredient.get("quantity", 0)
-        unit = ingredient.get("unit", "")
-
-        # Calculate scaled quantity
-        scaled_qty = original_qty * scaling_factor
-
-        # Format numbers nicely
-        if scaled_qty == int(scaled_qty):
-            scaled_str = str(int(scaled_qty))
-        else:
-            # For very small amounts, show more precision
-            if scaled_qty < 0.1:
-                scaled_str = f"{scaled_qty:.3f}".rstrip("0").rstrip(".")
-            else:
-                scaled_str = f"{scaled_qty:.2f}".rstrip("0").rstrip(".")
-
-        scaled_table.add_row(name, scaled_str, unit)
+    # Calculate scaled quantities, then format them in one pass
+    ingredient_rows = recipe_data["_ingredients"]
+    scaled_qtys = [qty * scaling_factor for _, qty, _ in ingredient_rows]
+    # Very small amounts get more precision
+    rows = [
+        (name, _fmt_qty(scaled_qty, 3 if scaled_qty < 0.1 else 2), unit)
+        for (name, _, unit), scaled_qty in zip(ingredient_rows, scaled_qtys)
+    ]
+    add_row = scaled_table.add_row
+    for row in rows:
+        add_row(*row)
 
     console.print(scaled_table)
 
@@ -786,7 +830,7 @@ def perform_recipe_calculation(recipe_data):
 def delete_recipe():
     """Delete an existing recipe"""
     console.clear()
-    console.print("[bold red]═══ Delete Recipe ═══[/bold red]\n")
+    console.print(_HDR_DELETE)
 
     recipes_dir = "Saved Recipes"
 
@@ -797,145 +841,158 @@ def delete_recipe():
         )
         return
 
-    # Get all JSON files in the recipes directory
-    recipe_files = [f for f in os.listdir(recipes_dir) if f.endswith(".json")]
+    # Load all recipe data, sorted by name
+    all_recipes = _load_all_recipes(recipes_dir)
 
-    if not recipe_files:
+    if not all_recipes:
         console.print("[yellow]No recipes found. No recipes to delete![/yellow]")
         return
 
-    # Sort recipes alphabetically
-    recipe_files.sort()
-
-    console.print(
-        f"[yellow]Found {len(recipe_files)} recipe(s) to choose from:[/yellow]\n"
-    )
-    console.print("[dim]⚠️  This action cannot be undone![/dim]\n")
-
-    # Create a table of available recipes
-    recipes_table = Table(show_header=True, header_style="bold magenta")
-    recipes_table.add_column("#", style="cyan", width=3)
-    recipes_table.add_column("Recipe Name", style="white")
-    recipes_table.add_column("Created", style="dim", width=12)
-    recipes_table.add_column("Ingredients", style="green", width=8)
-
-    recipe_data_list = []
-
-    for i, filename in enumerate(recipe_files, 1):
-        filepath = os.path.join(recipes_dir, filename)
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                recipe_data = json.load(f)
-
-            # Get recipe details
-            recipe_name = recipe_data.get("name", filename.replace(".json", ""))
-            created_date = recipe_data.get("created_date", "Unknown")
-            ingredients_count = len(recipe_data.get("ingredients", []))
-
-            # Format date for display
-            if created_date != "Unknown":
-                try:
-                    date_obj = datetime.datetime.fromisoformat(created_date)
-                    formatted_date = date_obj.strftime("%Y-%m-%d")
-                except:
-                    formatted_date = "Unknown"
-            else:
-                formatted_date = "Unknown"
+    # Pull out what the picker and confirmation show once, up front
+    recipe_data_list = [
+        (
+            filename,
+            os.path.join(recipes_dir, filename),
+            recipe_data.get("name", filename.replace(".json", "")),
+            len(recipe_data.get("ingredients", [])),
+            recipe_data["_display_date"],
+        )
+        for filename, recipe_data in all_recipes
+    ]
 
+    # Deleting another recipe goes around again with the list kept in memory
+    while True:
+        console.print(
+            f"[yellow]Found {len(recipe_data_list)} recipe(s) to choose from:[/yellow]\n"
+        )
+        console.print("[dim]⚠️  This action cannot be undone![/dim]\n")
+
+        # Create a table of available recipes
+        recipes_table = Table(show_header=True, header_style="bold magenta")
+        recipes_table.add_column("#", style="cyan", width=3)
+        recipes_table.add_column("Recipe Name", style="white")
+        recipes_table.add_column("Created", style="dim", width=12)
+        recipes_table.add_column("Ingredients", style="green", width=8)
+
+        for i, (_, _, recipe_name, ingredients_count, display_date) in enumerate(
+            recipe_data_list, 1
+        ):
             recipes_table.add_row(
-                str(i), recipe_name, formatted_date, f"{ingredients_count} items"
+                str(i), recipe_name, display_date, f"{ingredients_count} items"
             )
-            recipe_data_list.append((filename, recipe_data, filepath))
 
-        except Exception as e:
-            console.print(f"[red]Error reading {filename}: {e}[/red]")
-            continue
-
-    console.print(recipes_table)
+        console.print(recipes_table)
 
-    # Let user select a recipe to delete
-    while True:
-        try:
-            choice = (
-                Prompt.ask(
-                    f"\n[bold yellow]Enter recipe number to DELETE (1-{len(recipe_data_list)}) or 'q' to cancel[/bold yellow]",
-                    default="q",
-                )
-                .strip()
-                .lower()
-            )
-
-            if choice == "q":
-                console.print("[green]Delete operation cancelled.[/green]")
-                return
+        # Built once per listing; the count only changes after a deletion
+        count = len(recipe_data_list)
+        prompt_text = f"\n[bold yellow]Enter recipe number(s) to DELETE (1-{count}, e.g. 1,3 or 2-4) or 'q' to cancel[/bold yellow]"
+        out_of_range_text = f"[red]Please enter numbers between 1 and {count}[/red]"
 
-            choice_num = int(choice)
-            if 1 <= choice_num <= len(recipe_data_list):
-                filename, recipe_data, filepath = recipe_data_list[choice_num - 1]
+        # Let user select one or more recipes to delete
+        while True:
+            try:
+                choice = Prompt.ask(prompt_text, default="q").strip().lower()
 
-                # Show the recipe that will be deleted
-                recipe_name = recipe_data.get("name", "Unknown Recipe")
-                console.print(f"\n[bold red]You are about to delete:[/bold red]")
-                console.print(f"[white]Recipe: {recipe_name}[/white]")
-                console.print(f"[dim]File: {filename}[/dim]")
+                if choice == "q":
+                    console.print("[green]Delete operation cancelled.[/green]")
+                    return
 
-                # Show ingredients count
-                ingredients = recipe_data.get("ingredients", [])
-                console.print(f"[dim]Contains {len(ingredients)} ingredient(s)[/dim]")
+                choice_nums = _parse_selection(choice, count)
+                if choice_nums is not None:
+                    selected = [recipe_data_list[n - 1] for n in choice_nums]
 
-                # Double confirmation
-                console.print(
-                    f"\n[bold red]⚠️  This will permanently delete the recipe![/bold red]"
-                )
+                    # Show the recipes that will be deleted
+                    console.print(f"\n[bold red]You are about to delete:[/bold red]")
+                    for filename, _, recipe_name, ingredients_count, _ in selected:
+                        console.print(f"[white]Recipe: {recipe_name}[/white]")
+                        console.print(f"[dim]File: {filename}[/dim]")
+                        console.print(
+                            f"[dim]Contains {ingredients_count} ingredient(s)[/dim]"
+                        )
 
-                if Confirm.ask(
-                    f"[red]Are you absolutely sure you want to delete '{recipe_name}'?[/red]"
-                ):
-                    try:
-                        os.remove(filepath)
+                    # Double confirmation, once for the whole selection
+                    if len(selected) == 1:
+                        what = f"'{recipe_name}'"
+                        not_deleted = f"Recipe '{recipe_name}' was not deleted."
+                        console.print(
+                            f"\n[bold red]⚠️  This will permanently delete the recipe![/bold red]"
+                        )
+                    else:
+                        what = f"these {len(selected)} recipes"
+                        not_deleted = "No recipes were deleted."
                         console.print(
-                            f"\n[bold green]✓ Recipe '{recipe_name}' has been deleted successfully![/bold green]"
+                            f"\n[bold red]⚠️  This will permanently delete {len(selected)} recipes![/bold red]"
                         )
-                        console.print(f"[dim]Removed: {filepath}[/dim]")
+
+                    if Confirm.ask(
+                        f"[red]Are you absolutely sure you want to delete {what}?[/red]"
+                    ):
+                        # Unlink by name against one open directory handle
+                        # instead of resolving every full path again
+                        dir_fd = _open_dir_fd(recipes_dir)
+
+                        removed = []
+                        try:
+                            for choice_num, row in zip(choice_nums, selected):
+                                filename, filepath, recipe_name = row[:3]
+                                try:
+                                    os.unlink(
+                                        filepath if dir_fd is None else filename,
+                                        dir_fd=dir_fd,
+                                    )
+                                except Exception as e:
+                                    console.print(
+                                        f"[bold red]Error deleting recipe '{recipe_name}': {e}[/bold red]"
+                                    )
+                                    continue
+                                _RECIPE_CACHE.pop(filepath, None)
+                                removed.append(choice_num)
+                                console.print(
+                                    f"\n[bold green]✓ Recipe '{recipe_name}' has been deleted successfully![/bold green]"
+                                )
+                                console.print(f"[dim]Removed: {filepath}[/dim]")
+                        finally:
+                            if dir_fd is not None:
+                                os.close(dir_fd)
+
+                        # Highest first so the remaining positions stay valid
+                        for choice_num in reversed(removed):
+                            del recipe_data_list[choice_num - 1]
+
+                        if len(removed) < len(selected):
+                            return
 
                         # Ask if they want to delete another recipe
-                        if recipe_data_list and len(recipe_data_list) > 1:
+                        if recipe_data_list:
                             if Confirm.ask("\n[cyan]Delete another recipe?[/cyan]"):
-                                # Refresh the list and start over
-                                delete_recipe()
-                                return
+                                # Redraw the picker from the remaining recipes
+                                console.clear()
+                                console.print(_HDR_DELETE)
+                                break
                         else:
                             console.print(
                                 "\n[yellow]No more recipes to delete.[/yellow]"
                             )
 
                         return
+                    else:
+                        console.print(f"[green]Delete cancelled. {not_deleted}[/green]")
 
-                    except Exception as e:
-                        console.print(
-                            f"[bold red]Error deleting recipe: {e}[/bold red]"
-                        )
-                        return
+                        # Ask if they want to try deleting a different recipe
+                        if Confirm.ask("\n[cyan]Delete a different recipe?[/cyan]"):
+                            continue
+                        else:
+                            return
                 else:
-                    console.print(
-                        f"[green]Delete cancelled. Recipe '{recipe_name}' was not deleted.[/green]"
-                    )
+                    console.print(out_of_range_text)
 
-                    # Ask if they want to try deleting a different recipe
-                    if Confirm.ask("\n[cyan]Delete a different recipe?[/cyan]"):
-                        continue
-                    else:
-                        return
-            else:
+            except ValueError:
                 console.print(
-                    f"[red]Please enter a number between 1 and {len(recipe_data_list)}[/red]"
+                    "[red]Please enter recipe numbers (e.g. 1,3 or 2-4) or 'q' to cancel[/red]"
                 )
-
-        except ValueError:
-            console.print("[red]Please enter a valid number or 'q' to cancel[/red]")
-        except KeyboardInterrupt:
-            console.print("\n[green]Delete operation cancelled.[/green]")
-            return
+            except KeyboardInterrupt:
+                console.print("\n[green]Delete operation cancelled.[/green]")
+                return
 
 
 if __name__ == "__main__":